@@ -115,6 +115,11 @@ STORAGES["default"] = {"BACKEND": BASE_FILE_STORAGE}
 
 BASEROW_LOGIN_ACTION_LOG_LIMIT = RateLimit.from_string("1000/s")
 
+# The default PBKDF2 hasher is deliberately slow and makes every user creation in
+# the tests take a few hundred milliseconds. The tests don't depend on the hashing
+# algorithm, so use a fast one.
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS = False
 
 CACHALOT_ENABLED = str_to_bool(os.getenv("CACHALOT_ENABLED", "false"))
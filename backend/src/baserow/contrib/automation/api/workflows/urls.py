@@ -1,4 +1,4 @@
-from django.urls import re_path
+from django.urls import path
 
 from baserow.contrib.automation.api.workflows.views import (
     AsyncAutomationDuplicateWorkflowView,
@@ -10,22 +10,22 @@ from baserow.contrib.automation.api.workflows.views import (
 app_name = "baserow.contrib.automation.api.workflows"
 
 urlpatterns_with_automation_id = [
-    re_path(
-        r"$",
+    path(
+        "",
         AutomationWorkflowsView.as_view(),
         name="create",
     ),
-    re_path(r"order/$", OrderAutomationWorkflowsView.as_view(), name="order"),
+    path("order/", OrderAutomationWorkflowsView.as_view(), name="order"),
 ]
 
 urlpatterns_without_automation_id = [
-    re_path(
-        r"(?P<workflow_id>[0-9]+)/$",
+    path(
+        "<int:workflow_id>/",
         AutomationWorkflowView.as_view(),
         name="item",
     ),
-    re_path(
-        r"(?P<workflow_id>[0-9]+)/duplicate/async/$",
+    path(
+        "<int:workflow_id>/duplicate/async/",
         AsyncAutomationDuplicateWorkflowView.as_view(),
         name="async_duplicate",
     ),
@@ -5,28 +5,33 @@ class AutomationNodeError(AutomationError):
     pass
 
 
-class AutomationNodeNotInWorkflow(AutomationNodeError):
-    """When the specified node does not belong to a specific workflow."""
+class AutomationNodeIdError(AutomationNodeError):
+    """
+    Base class of the node errors related to a specific node. The message is only
+    formatted when the exception is converted to a string, because these exceptions
+    are often raised and caught without their message ever being read.
+    """
+
+    message_template = "The node {node_id} is invalid."
 
     def __init__(self, node_id=None, *args, **kwargs):
         self.node_id = node_id
-        super().__init__(
-            f"The node {node_id} does not belong to the workflow.",
-            *args,
-            **kwargs,
-        )
+        super().__init__(node_id, *args, **kwargs)
 
+    def __str__(self):
+        return self.message_template.format(node_id=self.node_id)
+
+
+class AutomationNodeNotInWorkflow(AutomationNodeIdError):
+    """When the specified node does not belong to a specific workflow."""
 
-class AutomationNodeDoesNotExist(AutomationNodeError):
+    message_template = "The node {node_id} does not belong to the workflow."
+
+
+class AutomationNodeDoesNotExist(AutomationNodeIdError):
     """When the node doesn't exist."""
 
-    def __init__(self, node_id=None, *args, **kwargs):
-        self.node_id = node_id
-        super().__init__(
-            f"The node {node_id} does not exist.",
-            *args,
-            **kwargs,
-        )
+    message_template = "The node {node_id} does not exist."
 
 
 class AutomationNodeBeforeInvalid(Exception):
@@ -37,13 +42,7 @@ class AutomationNodeBeforeInvalid(Exception):
     """
 
 
-class AutomationNodeMisconfiguredService(AutomationNodeError):
+class AutomationNodeMisconfiguredService(AutomationNodeIdError):
     """When the node's service is misconfigured."""
 
-    def __init__(self, node_id=None, *args, **kwargs):
-        self.node_id = node_id
-        super().__init__(
-            f"The node {node_id} has a misconfigured service.",
-            *args,
-            **kwargs,
-        )
+    message_template = "The node {node_id} has a misconfigured service."
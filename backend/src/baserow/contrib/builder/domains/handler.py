@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import Iterable, List, Optional, cast
 
-from django.db.models import QuerySet
+from django.db.models import Exists, OuterRef, QuerySet
 from django.db.utils import IntegrityError
 
 from baserow.contrib.builder.domains.exceptions import (
@@ -20,8 +20,17 @@ from baserow.core.models import Workspace
 from baserow.core.registries import ImportExportConfig, application_type_registry
 from baserow.core.storage import get_default_storage
 from baserow.core.trash.handler import TrashHandler
+from baserow.core.user_sources.models import UserSource
 from baserow.core.utils import Progress, extract_allowed
 
+# The configuration used to duplicate a builder when it's published. It's never
+# modified by the export or the import, so it can be shared by all publications.
+PUBLISH_IMPORT_EXPORT_CONFIG = ImportExportConfig(
+    include_permission_data=True,
+    reduce_disk_space_usage=False,
+    exclude_sensitive_data=False,
+)
+
 
 class DomainHandler:
     allowed_fields_create = ["domain_name"]
@@ -65,7 +74,10 @@ class DomainHandler:
         """
 
         if base_queryset is None:
-            base_queryset = Domain.objects.all()
+            # The specific domains are fetched with one query per content type, so the
+            # base query only has to provide the ids and the content types. A provided
+            # queryset is left untouched because it can have its own annotations.
+            base_queryset = Domain.objects.only("id", "content_type_id")
 
         return specific_iterator(base_queryset.filter(builder=builder))
 
@@ -79,10 +91,17 @@ class DomainHandler:
         """
 
         try:
+            # Only the published builder is loaded entirely, the other columns are the
+            # ones needed to check if the domain is trashed.
             domain = (
                 Domain.objects.exclude(published_to=None)
                 .select_related("published_to", "builder__workspace")
-                .only("published_to", "builder")
+                .only(
+                    "trashed",
+                    "published_to",
+                    "builder__trashed",
+                    "builder__workspace__trashed",
+                )
                 .get(domain_name=domain_name)
             )
         except Domain.DoesNotExist:
@@ -144,6 +163,8 @@ class DomainHandler:
 
         domain.delete()
 
+        self.invalidate_public_builder_by_domain_cache(domain.domain_name)
+
     def update_domain(self, domain: Domain, **kwargs) -> Domain:
         """
         Updates fields of a domain
@@ -165,16 +186,29 @@ class DomainHandler:
         if "domain_name" in prepared_values:
             prepared_values["domain_name"] = prepared_values["domain_name"].lower()
 
+        previous_domain_name = domain.domain_name
+
         for key, value in prepared_values.items():
             setattr(domain, key, value)
 
+        # Only the changed columns are written, Django skips the tables of the
+        # multi-table inheritance that don't own any of these fields. Values that
+        # don't map to a concrete field, which a domain type could prepare, are set on
+        # the instance but can't be part of `update_fields`.
+        concrete_field_names = {field.name for field in domain._meta.concrete_fields}
+        update_fields = [key for key in prepared_values if key in concrete_field_names]
+
         try:
-            domain.save()
+            domain.save(update_fields=update_fields)
         except IntegrityError as error:
             if "unique" in str(error) and "domain_name" in prepared_values:
                 raise DomainNameNotUniqueError(prepared_values["domain_name"])
             raise error
 
+        if domain.domain_name != previous_domain_name:
+            self.invalidate_public_builder_by_domain_cache(previous_domain_name)
+            self.invalidate_public_builder_by_domain_cache(domain.domain_name)
+
         return domain
 
     def order_domains(
@@ -216,12 +250,13 @@ class DomainHandler:
         :return: A queryset of published domain applications.
         """
 
-        applications = Builder.objects.exclude(published_from=None)
-        return (
-            applications.filter(published_from__builder__workspace=workspace)
-            if workspace
-            else applications
-        )
+        # The trashed domains are included because the builders published from them
+        # are still published domain applications.
+        domains = Domain.objects_and_trash.filter(published_to=OuterRef("pk"))
+        if workspace:
+            domains = domains.filter(builder__workspace_id=workspace.id)
+
+        return Builder.objects.filter(Exists(domains))
 
     def publish(self, domain: Domain, progress: Progress | None = None):
         """
@@ -235,8 +270,15 @@ class DomainHandler:
         """
 
         # Make sure we are the only process to update the domain to prevent race
-        # conditions
-        domain = DomainHandler().get_domain(domain.id, for_update=True)
+        # conditions. The builder, its workspace and the previous publication are
+        # fetched in the same query because they're all needed below.
+        domain = self.get_domain(
+            domain.id,
+            base_queryset=Domain.objects.select_related(
+                "builder__workspace", "published_to"
+            ),
+            for_update=True,
+        )
 
         builder = domain.builder
         workspace = builder.workspace
@@ -246,13 +288,7 @@ class DomainHandler:
             domain.published_to.delete()
 
         builder_application_type = application_type_registry.get("builder")
-
-        import_export_config = ImportExportConfig(
-            include_permission_data=True,
-            reduce_disk_space_usage=False,
-            exclude_sensitive_data=False,
-        )
-
+        import_export_config = PUBLISH_IMPORT_EXPORT_CONFIG
         default_storage = get_default_storage()
 
         exported_builder = builder_application_type.export_serialized(
@@ -276,18 +312,21 @@ class DomainHandler:
         )
         domain.published_to = duplicate_builder
         domain.last_published = datetime.now(tz=timezone.utc)
-        domain.save()
+        domain.save(update_fields=["published_to", "last_published"])
 
         # We need a stable/predictable uuid for published user sources. That's why we
         # override the generated uuid with the uuid from the original user_source
         # prefixed with the domain id.
         # For a certain domain the domain id is always the same as long as you don't
         # recreate it.
+        imported_user_sources = list(duplicate_builder.user_sources.only("id", "uid"))
+        original_user_sources = list(builder.user_sources.only("id", "uid"))
         for imported_user_source, original_user_source in zip(
-            duplicate_builder.user_sources.all(), builder.user_sources.all()
+            imported_user_sources, original_user_sources
         ):
             imported_user_source.uid = f"domain_{domain.id}__{original_user_source.uid}"
-            imported_user_source.save()
+
+        UserSource.objects.bulk_update(imported_user_sources, ["uid"], batch_size=500)
 
         # Invalidate the public builder-by-domain cache after a new publication.
         DomainHandler.invalidate_public_builder_by_domain_cache(domain.domain_name)
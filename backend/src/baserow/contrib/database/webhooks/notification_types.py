@@ -1,14 +1,11 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from typing import List
 
 from django.conf import settings
 from django.utils.translation import gettext as _
 
-from baserow.core.models import (
-    WORKSPACE_USER_PERMISSION_ADMIN,
-    Workspace,
-    WorkspaceUser,
-)
+from baserow.contrib.database.table.models import Table
+from baserow.core.models import WORKSPACE_USER_PERMISSION_ADMIN, User, Workspace
 from baserow.core.notifications.handler import NotificationHandler
 from baserow.core.notifications.models import NotificationRecipient
 from baserow.core.notifications.registries import (
@@ -35,6 +32,29 @@ class DeactivatedWebhookData:
             webhook_name=webhook.name,
         )
 
+    def to_dict(self) -> dict:
+        # A shallow copy is enough because all the values are immutable, contrary to
+        # `asdict` which deep copies every value.
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+
+def get_webhook_workspace(webhook: TableWebhook) -> Workspace:
+    """
+    Returns the workspace of the webhook. If the table isn't already loaded, the
+    table, database and workspace are fetched with a single query and cached on the
+    webhook, so that accessing `webhook.table.database` afterwards doesn't result in
+    additional queries.
+
+    :param webhook: The webhook to get the workspace for.
+    :return: The workspace that the webhook belongs to.
+    """
+
+    if not TableWebhook.table.is_cached(webhook):
+        webhook.table = Table.objects_and_trash.select_related(
+            "database__workspace"
+        ).get(id=webhook.table_id)
+    return webhook.table.database.workspace
+
 
 def notify_admins_in_workspace(
     workspace: Workspace, notification_type: str, data: dict
@@ -49,13 +69,14 @@ def notify_admins_in_workspace(
     :return: A list of created notification recipients.
     """
 
-    admins_workspace_users = WorkspaceUser.objects.filter(
-        workspace=workspace,
-        permissions=WORKSPACE_USER_PERMISSION_ADMIN,
-        user__profile__to_be_deleted=False,
-        user__is_active=True,
-    ).select_related("user")
-    admins_in_workspace = [admin.user for admin in admins_workspace_users]
+    # Passing a users queryset lets the handler select the related profiles in the
+    # same query instead of instantiating the workspace users first.
+    admins_in_workspace = User.objects.filter(
+        workspaceuser__workspace=workspace,
+        workspaceuser__permissions=WORKSPACE_USER_PERMISSION_ADMIN,
+        profile__to_be_deleted=False,
+        is_active=True,
+    )
 
     return NotificationHandler.create_direct_notification_for_users(
         notification_type=notification_type,
@@ -82,9 +103,9 @@ class WebhookDeactivatedNotificationType(EmailNotificationTypeMixin, Notificatio
         :return: A list of notification recipients that have been created.
         """
 
-        workspace = webhook.table.database.workspace
+        workspace = get_webhook_workspace(webhook)
         return notify_admins_in_workspace(
-            workspace, cls.type, asdict(DeactivatedWebhookData.from_webhook(webhook))
+            workspace, cls.type, DeactivatedWebhookData.from_webhook(webhook).to_dict()
         )
 
     @classmethod
@@ -123,6 +144,9 @@ class WebhookPayloadTooLargeData:
             batch_limit=webhook.batch_limit,
         )
 
+    def to_dict(self) -> dict:
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
 
 class WebhookPayloadTooLargeNotificationType(
     EmailNotificationTypeMixin, NotificationType
@@ -143,11 +167,11 @@ class WebhookPayloadTooLargeNotificationType(
         :return: A list of notification recipients that have been created.
         """
 
-        workspace = webhook.table.database.workspace
+        workspace = get_webhook_workspace(webhook)
         return notify_admins_in_workspace(
             workspace,
             cls.type,
-            asdict(WebhookPayloadTooLargeData.from_webhook(webhook, event_id)),
+            WebhookPayloadTooLargeData.from_webhook(webhook, event_id).to_dict(),
         )
 
     @classmethod
@@ -97,9 +97,13 @@ def call_webhook(
     try:
         with transaction.atomic():
             try:
-                webhook = TableWebhook.objects.select_for_update(
-                    of=("self",), nowait=True
-                ).get(id=webhook_id, active=True)
+                # The workspace is selected as well because it's needed to notify
+                # the admins if the webhook is deactivated or the payload too large.
+                webhook = (
+                    TableWebhook.objects.select_for_update(of=("self",), nowait=True)
+                    .select_related("table__database__workspace")
+                    .get(id=webhook_id, active=True)
+                )
             except TableWebhook.DoesNotExist:
                 # If the webhook has been deleted or disabled while executing, we don't
                 # want to continue making calls the URL because we can't update the
@@ -29,7 +29,10 @@ from baserow.contrib.builder.data_providers.exceptions import (
     DataProviderChunkInvalidException,
     FormDataProviderChunkInvalidException,
 )
-from baserow.contrib.database.api.fields.serializers import FieldSerializer
+from baserow.contrib.database.api.fields.serializers import (
+    FieldSerializer,
+    SelectOptionSerializer,
+)
 from baserow.contrib.database.api.rows.serializers import (
     RowSerializer,
     get_row_serializer_class,
@@ -46,6 +49,7 @@ from baserow.contrib.database.fields.field_types import (
     MultipleCollaboratorsFieldType,
 )
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import SelectOption
 from baserow.contrib.database.fields.operations import WriteFieldValuesOperationType
 from baserow.contrib.database.fields.registries import (
     field_aggregation_registry,
@@ -585,16 +589,26 @@ class LocalBaserowTableServiceType(LocalBaserowServiceType):
         if field_objects is None:
             return None
 
-        ret = {}
-        for field_object in field_objects:
-            field_type = field_object["type"]
-            if field_type.can_have_select_options:
-                field_serializer = field_type.get_serializer(
-                    field_object["field"], FieldSerializer
-                )
-                ret[field_object["name"]] = field_serializer.data["select_options"]
+        field_names_by_id = {
+            field_object["field"].id: field_object["name"]
+            for field_object in field_objects
+            if field_object["type"].can_have_select_options
+        }
 
-        return ret
+        # Fetch the options of all the select fields with a single query instead of
+        # serializing each field, which costs a couple of queries per field.
+        select_options_by_name = {name: [] for name in field_names_by_id.values()}
+        for select_option in SelectOption.objects.filter(
+            field_id__in=field_names_by_id
+        ):
+            select_options_by_name[field_names_by_id[select_option.field_id]].append(
+                select_option
+            )
+
+        return {
+            name: SelectOptionSerializer(select_options, many=True).data
+            for name, select_options in select_options_by_name.items()
+        }
 
     def get_context_data_schema(
         self, service: ServiceSubClass, allowed_fields: Optional[List[str]] = None
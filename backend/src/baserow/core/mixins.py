@@ -59,35 +59,39 @@ class OrderableMixin:
         :return: The full ordered list of ids.
         """
 
-        new_order = list(new_order)
+        # Duplicated ids are ignored, only their first occurrence is respected.
+        new_order = list(dict.fromkeys(new_order))
         previous_full_id_order = list(queryset.values_list("id", flat=True))
+        previous_ids = set(previous_full_id_order)
 
         for new_order_id in new_order:
-            if new_order_id not in previous_full_id_order:
+            if new_order_id not in previous_ids:
                 raise IdDoesNotExist(new_order_id)
 
-        new_full_order = []
-        current = 0
-
-        # Support order with partial input list
-        while previous_full_id_order:
-            obj_id = previous_full_id_order[current]
-
-            # obj_id not in new order, let's append it
-            if obj_id not in new_order:
-                previous_full_id_order.pop(current)
-                new_full_order.append(obj_id)
-                current = 0
-            # obj_id is equal to first element of new_order, let's append it
-            elif obj_id == new_order[0]:
-                previous_full_id_order.pop(current)
-                new_full_order.append(obj_id)
-                new_order.pop(0)
-                current = 0
-            # obj_id is in the list but it's not the first element. Then skip it for
-            # now but let's take a look at the next id
+        # Support order with partial input list. The objects that are not in the new
+        # order keep their relative order. Each object of the new order is placed
+        # right after the last object, not in the new order, that was before it,
+        # unless that would place it before the previous object of the new order.
+        new_order_ids = set(new_order)
+        other_ids = []
+        other_ids_before = {}
+        for obj_id in previous_full_id_order:
+            if obj_id in new_order_ids:
+                other_ids_before[obj_id] = len(other_ids)
             else:
-                current += 1
+                other_ids.append(obj_id)
+
+        new_full_order = []
+        new_order_index = 0
+        for other_index, other_id in enumerate(other_ids):
+            while (
+                new_order_index < len(new_order)
+                and other_ids_before[new_order[new_order_index]] <= other_index
+            ):
+                new_full_order.append(new_order[new_order_index])
+                new_order_index += 1
+            new_full_order.append(other_id)
+        new_full_order.extend(new_order[new_order_index:])
 
         queryset.update(
             **{
@@ -69,6 +69,16 @@ class FieldFixtures:
 
         return SelectOption.objects.create(**kwargs)
 
+    def create_select_options(self, field, options):
+        """
+        Creates the select options described by the `options` kwargs dicts for the
+        field with a single insert.
+        """
+
+        return SelectOption.objects.bulk_create(
+            [SelectOption(field=field, **option) for option in options]
+        )
+
     def create_text_field(self, user=None, create_field=True, **kwargs):
         self.set_test_field_kwarg_defaults(user, kwargs)
 
@@ -1,5 +1,6 @@
 from baserow.contrib.builder.pages.handler import PageHandler
 from baserow.contrib.builder.pages.models import Page
+from baserow.core.utils import find_unused_name
 
 
 class PageFixtures:
@@ -24,3 +25,29 @@ class PageFixtures:
         page = Page.objects.create(**kwargs)
 
         return page
+
+    def create_builder_pages(self, count, user=None, **kwargs):
+        """
+        Creates `count` pages in the same builder with a single insert.
+        """
+
+        if not kwargs.get("builder", None):
+            if user is None:
+                user = self.create_user()
+
+            kwargs["builder"] = self.create_builder_application(user=user)
+
+        builder = kwargs["builder"]
+        first_order = Page.get_last_order(builder)
+        existing_names = list(builder.page_set.values_list("name", flat=True))
+
+        pages = []
+        for index in range(count):
+            name = self.fake.unique.uri_page()
+            path = find_unused_name([name], existing_names, max_length=255)
+            existing_names.append(path)
+            pages.append(
+                Page(name=name, path=path, order=first_order + index, **kwargs)
+            )
+
+        return Page.objects.bulk_create(pages)
@@ -9,9 +9,13 @@ MIGRATION_DIRS = [
     # Add more migration directories here if needed.
 ]
 
-# Matches all SQL functions in migration files.
+# Matches all SQL functions in migration files. A match can't contain the start of
+# another function, so a function without a recognised terminator stops the search at
+# the next function instead of scanning, and possibly matching, up to the end of the
+# file.
 FORMULA_PATTERN = re.compile(
-    r"create or replace function.*?language plpgsql;|create or replace function.*?language sql immutable strict;",
+    rb"create or replace function(?:(?!create or replace function).)*?"
+    rb"language (?:plpgsql|sql immutable strict);",
     re.DOTALL | re.IGNORECASE,
 )
 
@@ -29,8 +33,8 @@ def iter_formula_pgsql_functions() -> Iterable[str]:
             for file in files:
                 if file.endswith(".py"):
                     file_path = os.path.join(root, file)
-                    with open(file_path, "r") as f:
+                    with open(file_path, "rb") as f:
                         content = f.read()
                         matches = FORMULA_PATTERN.findall(content)
                         for match in matches:
-                            yield match.replace("\\\\", "\\")
+                            yield match.decode().replace("\\\\", "\\")
@@ -12,6 +12,9 @@ from baserow.core.exceptions import UserNotInWorkspace
 
 SERVICES_PATH = "baserow.contrib.automation.workflows.service"
 
+# The service is stateless, so a single instance is shared by all the tests.
+SERVICE = AutomationWorkflowService()
+
 
 @pytest.mark.django_db
 def test_get_workflow_returns_workflow(data_fixture):
@@ -19,7 +22,7 @@ def test_get_workflow_returns_workflow(data_fixture):
     automation = data_fixture.create_automation_application(user=user)
     workflow = data_fixture.create_automation_workflow(automation=automation)
 
-    returned_workflow = AutomationWorkflowService().get_workflow(user, workflow.id)
+    returned_workflow = SERVICE.get_workflow(user, workflow.id)
 
     assert returned_workflow == workflow
 
@@ -29,7 +32,7 @@ def test_get_workflow_raises_does_not_exist(data_fixture):
     user = data_fixture.create_user()
 
     with pytest.raises(AutomationWorkflowDoesNotExist):
-        AutomationWorkflowService().get_workflow(user, 999)
+        SERVICE.get_workflow(user, 999)
 
 
 @pytest.mark.django_db
@@ -39,7 +42,7 @@ def test_get_workflow_user_not_in_workspace(data_fixture):
     workflow = data_fixture.create_automation_workflow(automation=automation)
 
     with pytest.raises(UserNotInWorkspace):
-        AutomationWorkflowService().get_workflow(user, workflow.id)
+        SERVICE.get_workflow(user, workflow.id)
 
 
 @patch(f"{SERVICES_PATH}.automation_workflow_created")
@@ -47,12 +50,11 @@ def test_get_workflow_user_not_in_workspace(data_fixture):
 def test_workflow_created_signal_sent(workflow_created_mock, data_fixture):
     user = data_fixture.create_user()
     automation = data_fixture.create_automation_application(user=user)
-    service = AutomationWorkflowService()
 
-    workflow = service.create_workflow(user, automation.id, "test")
+    workflow = SERVICE.create_workflow(user, automation.id, "test")
 
     workflow_created_mock.send.assert_called_once_with(
-        service, workflow=workflow, user=user
+        SERVICE, workflow=workflow, user=user
     )
 
 
@@ -62,7 +64,7 @@ def test_create_workflow_user_not_in_workspace(data_fixture):
     automation = data_fixture.create_automation_application()
 
     with pytest.raises(UserNotInWorkspace):
-        AutomationWorkflowService().create_workflow(user, automation.id, "test")
+        SERVICE.create_workflow(user, automation.id, "test")
 
 
 @patch(f"{SERVICES_PATH}.automation_workflow_deleted")
@@ -72,11 +74,10 @@ def test_workflow_deleted_signal_sent(workflow_deleted_mock, data_fixture):
     automation = data_fixture.create_automation_application(user=user)
     workflow = data_fixture.create_automation_workflow(automation=automation)
 
-    service = AutomationWorkflowService()
-    service.delete_workflow(user, workflow.id)
+    SERVICE.delete_workflow(user, workflow.id)
 
     workflow_deleted_mock.send.assert_called_once_with(
-        service,
+        SERVICE,
         automation=automation,
         workflow_id=workflow.id,
         user=user,
@@ -89,12 +90,12 @@ def test_delete_workflow_user_not_in_workspace(data_fixture):
     another_user = data_fixture.create_user()
     automation = data_fixture.create_automation_application(user=user)
 
-    workflow = AutomationWorkflowService().create_workflow(user, automation.id, "test")
+    workflow = SERVICE.create_workflow(user, automation.id, "test")
 
     previous_count = AutomationWorkflow.objects.count()
 
     with pytest.raises(UserNotInWorkspace):
-        AutomationWorkflowService().delete_workflow(another_user, workflow.id)
+        SERVICE.delete_workflow(another_user, workflow.id)
 
     assert AutomationWorkflow.objects.count() == previous_count
 
@@ -106,11 +107,10 @@ def test_workflow_updated_signal_sent(workflow_updated_mock, data_fixture):
     automation = data_fixture.create_automation_application(user=user)
     workflow = data_fixture.create_automation_workflow(automation=automation)
 
-    service = AutomationWorkflowService()
-    service.update_workflow(user, workflow.id, name="new")
+    SERVICE.update_workflow(user, workflow.id, name="new")
 
     workflow_updated_mock.send.assert_called_once_with(
-        service, workflow=workflow, user=user
+        SERVICE, workflow=workflow, user=user
     )
 
 
@@ -121,7 +121,7 @@ def test_update_workflow_user_not_in_workspace(data_fixture):
     workflow = data_fixture.create_automation_workflow(automation=automation)
 
     with pytest.raises(UserNotInWorkspace):
-        AutomationWorkflowService().update_workflow(user, workflow.id, name="test")
+        SERVICE.update_workflow(user, workflow.id, name="test")
 
 
 @pytest.mark.django_db
@@ -130,9 +130,7 @@ def test_update_workflow_ignores_invalid_values(data_fixture):
     automation = data_fixture.create_automation_application(user=user)
     workflow = data_fixture.create_automation_workflow(automation=automation)
 
-    updated_workflow = AutomationWorkflowService().update_workflow(
-        user, workflow.id, foo="bar"
-    )
+    updated_workflow = SERVICE.update_workflow(user, workflow.id, foo="bar")
 
     assert hasattr(updated_workflow, "foo") is False
 
@@ -145,13 +143,12 @@ def test_workflows_reordered_signal_sent(workflows_reordered_mock, data_fixture)
     workflow_1 = data_fixture.create_automation_workflow(automation=automation, order=1)
     workflow_2 = data_fixture.create_automation_workflow(automation=automation, order=2)
 
-    service = AutomationWorkflowService()
-    workflow_orders = service.order_workflows(
+    workflow_orders = SERVICE.order_workflows(
         user, automation, [workflow_2.id, workflow_1.id]
     )
 
     workflows_reordered_mock.send.assert_called_once_with(
-        service, automation=automation, order=workflow_orders, user=user
+        SERVICE, automation=automation, order=workflow_orders, user=user
     )
 
 
@@ -163,9 +160,7 @@ def test_order_workflows_user_not_in_workspace(data_fixture):
     workflow_2 = data_fixture.create_automation_workflow(automation=automation, order=2)
 
     with pytest.raises(UserNotInWorkspace):
-        AutomationWorkflowService().order_workflows(
-            user, automation, [workflow_2.id, workflow_1.id]
-        )
+        SERVICE.order_workflows(user, automation, [workflow_2.id, workflow_1.id])
 
 
 @pytest.mark.django_db
@@ -176,9 +171,7 @@ def test_order_workflows_not_in_automation(data_fixture):
     workflow_2 = data_fixture.create_automation_workflow(order=2)
 
     with pytest.raises(AutomationWorkflowNotInAutomation):
-        AutomationWorkflowService().order_workflows(
-            user, automation, [workflow_2.id, workflow_1.id]
-        )
+        SERVICE.order_workflows(user, automation, [workflow_2.id, workflow_1.id])
 
 
 @pytest.mark.django_db
@@ -187,7 +180,7 @@ def test_duplicate_workflow(data_fixture):
     automation = data_fixture.create_automation_application(user=user)
     workflow = data_fixture.create_automation_workflow(automation=automation)
 
-    workflow_clone = AutomationWorkflowService().duplicate_workflow(user, workflow)
+    workflow_clone = SERVICE.duplicate_workflow(user, workflow)
 
     assert workflow_clone.order != workflow.order
     assert workflow_clone.id != workflow.id
@@ -200,4 +193,4 @@ def test_duplicate_workflow_user_not_in_workspace(data_fixture):
     workflow = data_fixture.create_automation_workflow()
 
     with pytest.raises(UserNotInWorkspace):
-        AutomationWorkflowService().duplicate_workflow(user, workflow)
+        SERVICE.duplicate_workflow(user, workflow)
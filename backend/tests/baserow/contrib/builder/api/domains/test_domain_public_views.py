@@ -1,6 +1,7 @@
 from unittest.mock import ANY, MagicMock, patch
 
-from django.test.utils import override_settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.urls import reverse
 
 import pytest
@@ -17,6 +18,7 @@ from baserow.contrib.builder.data_sources.exceptions import (
     DataSourceDoesNotExist,
     DataSourceImproperlyConfigured,
 )
+from baserow.contrib.builder.domains.handler import DomainHandler
 from baserow.contrib.builder.elements.models import Element
 from baserow.contrib.builder.pages.models import Page
 from baserow.contrib.database.views.models import SORT_ORDER_ASC
@@ -96,16 +98,37 @@ def data_source_fixture(data_fixture):
     }
 
 
+def get_public_page_dict(page, **kwargs):
+    """
+    Returns the expected public serialization of the given page. The kwargs
+    override the values read from the page.
+    """
+
+    return {
+        "id": page.id,
+        "name": page.name,
+        "path": page.path,
+        "path_params": [],
+        "query_params": [],
+        "shared": False,
+        "visibility": Page.VISIBILITY_TYPES.ALL.value,
+        "role_type": Page.ROLE_TYPES.ALLOW_ALL.value,
+        "roles": [],
+        **kwargs,
+    }
+
+
 @pytest.mark.django_db
 def test_get_public_builder_by_domain_name(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token()
-    favicon_file = data_fixture.create_user_file(original_extension=".png")
+    favicon_file = data_fixture.create_user_file(
+        original_extension=".png", uploaded_by=user
+    )
     builder_to = data_fixture.create_builder_application(
         workspace=None,
         favicon_file=favicon_file,
     )
-    page = data_fixture.create_builder_page(user=user, builder=builder_to)
-    page2 = data_fixture.create_builder_page(user=user, builder=builder_to)
+    page, page2 = data_fixture.create_builder_pages(2, user=user, builder=builder_to)
 
     domain = data_fixture.create_builder_custom_domain(
         domain_name="xyztest.getbaserow.io", published_to=builder_to
@@ -129,9 +152,8 @@ def test_get_public_builder_by_domain_name(api_client, data_fixture):
 
     del response_json["theme"]  # We are not testing the theme response here.
 
-    assert builder_to.page_set.filter(shared=True).count() == 1
-
-    shared_page = builder_to.shared_page
+    # Fails if there isn't exactly one shared page.
+    shared_page = builder_to.page_set.get(shared=True)
     workspace = Workspace.objects.get()
 
     assert (
@@ -146,39 +168,11 @@ def test_get_public_builder_by_domain_name(api_client, data_fixture):
         "licenses": [],
     }
     assert response_json["pages"] == [
-        {
-            "id": shared_page.id,
-            "name": "__shared__",
-            "path": "__shared__",
-            "path_params": [],
-            "query_params": [],
-            "shared": True,
-            "visibility": Page.VISIBILITY_TYPES.ALL.value,
-            "role_type": Page.ROLE_TYPES.ALLOW_ALL.value,
-            "roles": [],
-        },
-        {
-            "id": page.id,
-            "name": page.name,
-            "path": page.path,
-            "path_params": [],
-            "query_params": [],
-            "shared": False,
-            "visibility": Page.VISIBILITY_TYPES.ALL.value,
-            "role_type": Page.ROLE_TYPES.ALLOW_ALL.value,
-            "roles": [],
-        },
-        {
-            "id": page2.id,
-            "name": page2.name,
-            "path": page2.path,
-            "path_params": [],
-            "query_params": [],
-            "shared": False,
-            "visibility": Page.VISIBILITY_TYPES.ALL.value,
-            "role_type": Page.ROLE_TYPES.ALLOW_ALL.value,
-            "roles": [],
-        },
+        get_public_page_dict(
+            shared_page, name="__shared__", path="__shared__", shared=True
+        ),
+        get_public_page_dict(page),
+        get_public_page_dict(page2),
     ]
 
     # Even if I'm authenticated I should be able to see it.
@@ -190,11 +184,34 @@ def test_get_public_builder_by_domain_name(api_client, data_fixture):
     assert response.status_code == HTTP_200_OK
 
 
+@pytest.mark.django_db
+def test_get_public_builder_by_domain_name_cache_invalidated_on_domain_delete(
+    api_client, data_fixture
+):
+    builder_to = data_fixture.create_builder_application(workspace=None)
+    domain = data_fixture.create_builder_custom_domain(
+        domain_name="xyztest.getbaserow.io", published_to=builder_to
+    )
+
+    url = reverse(
+        "api:builder:domains:get_builder_by_domain_name",
+        kwargs={"domain_name": "xyztest.getbaserow.io"},
+    )
+
+    response = api_client.get(url, format="json")
+    assert response.status_code == HTTP_200_OK
+
+    DomainHandler().delete_domain(domain)
+
+    response = api_client.get(url, format="json")
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_BUILDER_DOES_NOT_EXIST"
+
+
 @pytest.mark.django_db
 def test_get_builder_missing_domain_name(api_client, data_fixture):
-    user, token = data_fixture.create_user_and_token()
-    page = data_fixture.create_builder_page(user=user)
-    page2 = data_fixture.create_builder_page(builder=page.builder, user=user)
+    user = data_fixture.create_user()
+    page, page2 = data_fixture.create_builder_pages(2, user=user)
 
     domain = data_fixture.create_builder_custom_domain(
         domain_name="test.getbaserow.io", published_to=page.builder
@@ -215,9 +232,8 @@ def test_get_builder_missing_domain_name(api_client, data_fixture):
 
 @pytest.mark.django_db
 def test_get_non_public_builder(api_client, data_fixture):
-    user, token = data_fixture.create_user_and_token()
-    page = data_fixture.create_builder_page(user=user)
-    data_fixture.create_builder_page(builder=page.builder, user=user)
+    user = data_fixture.create_user()
+    page, _ = data_fixture.create_builder_pages(2, user=user)
     data_fixture.create_builder_custom_domain(
         domain_name="notpublic.getbaserow.io", builder=page.builder
     )
@@ -238,15 +254,17 @@ def test_get_non_public_builder(api_client, data_fixture):
 @pytest.mark.django_db
 def test_get_public_builder_by_id(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token()
-    favicon_file = data_fixture.create_user_file(original_extension=".png")
-    page = data_fixture.create_builder_page(user=user)
-    page.builder.favicon_file = favicon_file
-    page.builder.save()
-    page2 = data_fixture.create_builder_page(builder=page.builder, user=user)
+    favicon_file = data_fixture.create_user_file(
+        original_extension=".png", uploaded_by=user
+    )
+    builder = data_fixture.create_builder_application(
+        user=user, favicon_file=favicon_file
+    )
+    page, page2 = data_fixture.create_builder_pages(2, builder=builder, user=user)
 
     url = reverse(
         "api:builder:domains:get_builder_by_id",
-        kwargs={"builder_id": page.builder.id},
+        kwargs={"builder_id": builder.id},
     )
 
     response = api_client.get(
@@ -262,64 +280,32 @@ def test_get_public_builder_by_id(api_client, data_fixture):
 
     del response_json["theme"]  # We are not testing the theme response here.
 
-    assert page.builder.page_set.filter(shared=True).count() == 1
+    # Fails if there isn't exactly one shared page.
+    shared_page = builder.page_set.get(shared=True)
+    workspace = builder.workspace
 
-    shared_page = page.builder.shared_page
-
-    assert (
-        response_json["favicon_file"]
-        == UserFileSerializer(page.builder.favicon_file).data
-    )
+    assert response_json["favicon_file"] == UserFileSerializer(favicon_file).data
     assert response_json["login_page_id"] is None
     assert response_json["workspace"] == {
         "generative_ai_models_enabled": {},
-        "id": page.builder.workspace.id,
-        "name": page.builder.workspace.name,
+        "id": workspace.id,
+        "name": workspace.name,
         "licenses": [],
     }
     assert response_json["pages"] == [
-        {
-            "id": shared_page.id,
-            "name": "__shared__",
-            "path": "__shared__",
-            "path_params": [],
-            "query_params": [],
-            "shared": True,
-            "visibility": Page.VISIBILITY_TYPES.ALL.value,
-            "role_type": Page.ROLE_TYPES.ALLOW_ALL.value,
-            "roles": [],
-        },
-        {
-            "id": page.id,
-            "name": page.name,
-            "path": page.path,
-            "path_params": [],
-            "query_params": [],
-            "shared": False,
-            "visibility": Page.VISIBILITY_TYPES.ALL.value,
-            "role_type": Page.ROLE_TYPES.ALLOW_ALL.value,
-            "roles": [],
-        },
-        {
-            "id": page2.id,
-            "name": page2.name,
-            "path": page2.path,
-            "path_params": [],
-            "query_params": [],
-            "shared": False,
-            "visibility": Page.VISIBILITY_TYPES.ALL.value,
-            "role_type": Page.ROLE_TYPES.ALLOW_ALL.value,
-            "roles": [],
-        },
+        get_public_page_dict(
+            shared_page, name="__shared__", path="__shared__", shared=True
+        ),
+        get_public_page_dict(page),
+        get_public_page_dict(page2),
     ]
 
 
 @pytest.mark.django_db
 def test_get_public_builder_by_id_other_user(api_client, data_fixture):
-    user, token = data_fixture.create_user_and_token()
+    user = data_fixture.create_user()
     other_user, other_token = data_fixture.create_user_and_token()
-    page = data_fixture.create_builder_page(user=user)
-    page2 = data_fixture.create_builder_page(builder=page.builder, user=user)
+    page, page2 = data_fixture.create_builder_pages(2, user=user)
 
     url = reverse(
         "api:builder:domains:get_builder_by_id",
@@ -335,13 +321,14 @@ def test_get_public_builder_by_id_other_user(api_client, data_fixture):
     assert response.status_code == HTTP_401_UNAUTHORIZED
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 @patch("baserow.core.jobs.handler.run_async_job")
-def test_publish_builder(mock_run_async_job, api_client, data_fixture):
+def test_publish_builder(
+    mock_run_async_job, api_client, data_fixture, django_capture_on_commit_callbacks
+):
     user, token = data_fixture.create_user_and_token()
     builder_from = data_fixture.create_builder_application(user=user)
-    page = data_fixture.create_builder_page(builder=builder_from, user=user)
-    page2 = data_fixture.create_builder_page(builder=builder_from, user=user)
+    page, page2 = data_fixture.create_builder_pages(2, builder=builder_from, user=user)
 
     domain = data_fixture.create_builder_custom_domain(
         domain_name="test.getbaserow.io", builder=builder_from
@@ -351,12 +338,13 @@ def test_publish_builder(mock_run_async_job, api_client, data_fixture):
         "api:builder:domains:publish",
         kwargs={"domain_id": domain.id},
     )
-    response = api_client.post(
-        url,
-        {"domain_id": domain.id},
-        format="json",
-        HTTP_AUTHORIZATION=f"JWT {token}",
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(
+            url,
+            {"domain_id": domain.id},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
 
     response_json = response.json()
 
@@ -367,6 +355,44 @@ def test_publish_builder(mock_run_async_job, api_client, data_fixture):
     assert args[0][0] == response_json["id"]
 
 
+PUBLIC_HEADING_ELEMENT = {
+    "type": "heading",
+    "order": "1.00000000000000000000",
+    "parent_element_id": None,
+    "place_in_container": None,
+    "visibility": "all",
+    "styles": {},
+    "style_border_top_color": "border",
+    "style_border_top_size": 0,
+    "style_padding_top": 10,
+    "style_margin_top": 0,
+    "style_border_bottom_color": "border",
+    "style_border_bottom_size": 0,
+    "style_padding_bottom": 10,
+    "style_margin_bottom": 0,
+    "style_border_left_color": "border",
+    "style_border_left_size": 0,
+    "style_padding_left": 20,
+    "style_margin_left": 0,
+    "style_border_right_color": "border",
+    "style_border_right_size": 0,
+    "style_padding_right": 20,
+    "style_margin_right": 0,
+    "style_background_radius": 0,
+    "style_border_radius": 0,
+    "style_background": "none",
+    "style_background_color": "#ffffffff",
+    "style_background_file": None,
+    "style_background_mode": "fill",
+    "style_width": "normal",
+    "style_width_child": "normal",
+    "role_type": "allow_all",
+    "roles": [],
+    "value": "",
+    "level": 1,
+}
+
+
 @pytest.mark.django_db
 def test_get_elements_of_public_builder(api_client, data_fixture):
     user = data_fixture.create_user()
@@ -393,53 +419,20 @@ def test_get_elements_of_public_builder(api_client, data_fixture):
     )
     response_json = response.json()
 
-    expected_item = {
-        "id": element1.id,
-        "page_id": page.id,
-        "type": "heading",
-        "order": "1.00000000000000000000",
-        "parent_element_id": None,
-        "place_in_container": None,
-        "visibility": "all",
-        "styles": {},
-        "style_border_top_color": "border",
-        "style_border_top_size": 0,
-        "style_padding_top": 10,
-        "style_margin_top": 0,
-        "style_border_bottom_color": "border",
-        "style_border_bottom_size": 0,
-        "style_padding_bottom": 10,
-        "style_margin_bottom": 0,
-        "style_border_left_color": "border",
-        "style_border_left_size": 0,
-        "style_padding_left": 20,
-        "style_margin_left": 0,
-        "style_border_right_color": "border",
-        "style_border_right_size": 0,
-        "style_padding_right": 20,
-        "style_margin_right": 0,
-        "style_background_radius": 0,
-        "style_border_radius": 0,
-        "style_background": "none",
-        "style_background_color": "#ffffffff",
-        "style_background_file": None,
-        "style_background_mode": "fill",
-        "style_width": "normal",
-        "style_width_child": "normal",
-        "role_type": "allow_all",
-        "roles": [],
-        "value": "",
-        "level": 1,
-    }
-
     assert response.status_code == HTTP_200_OK
     assert len(response_json) == 3
     # Test the structure of the first item to ensure the expected keys exist
-    assert response_json[0] == expected_item
+    assert response_json[0] == {
+        **PUBLIC_HEADING_ELEMENT,
+        "id": element1.id,
+        "page_id": page.id,
+    }
 
 
 @pytest.mark.django_db
-def test_get_elements_of_public_builder_with_deactivated(api_client, data_fixture):
+def test_get_elements_of_public_builder_with_deactivated(
+    api_client, data_fixture, monkeypatch
+):
     user = data_fixture.create_user()
     builder_from = data_fixture.create_builder_application(user=user)
     builder_to = data_fixture.create_builder_application(user=user, workspace=None)
@@ -450,8 +443,7 @@ def test_get_elements_of_public_builder_with_deactivated(api_client, data_fixtur
 
     element_type = element3.get_type()
 
-    prev_is_deactivated = element_type.is_deactivated
-    element_type.is_deactivated = lambda x: True
+    monkeypatch.setattr(element_type, "is_deactivated", lambda x: True)
 
     domain = data_fixture.create_builder_custom_domain(
         domain_name="test.getbaserow.io",
@@ -469,8 +461,6 @@ def test_get_elements_of_public_builder_with_deactivated(api_client, data_fixtur
     )
     response_json = response.json()
 
-    element_type.is_deactivated = prev_is_deactivated
-
     assert response.status_code == HTTP_200_OK
     assert len(response_json) == 2
 
@@ -567,31 +557,26 @@ def test_ask_public_builder_domain_exists(api_client, data_fixture):
     )
 
     url = reverse("api:builder:domains:ask_exists")
+
     response = api_client.get(url)
     assert response.status_code == 404
 
-    url = reverse("api:builder:domains:ask_exists") + "?domain="
-    response = api_client.get(url)
+    response = api_client.get(url, {"domain": ""})
     assert response.status_code == 404
 
-    url = reverse("api:builder:domains:ask_exists") + "?domain=nothing"
-    response = api_client.get(url)
+    response = api_client.get(url, {"domain": "nothing"})
     assert response.status_code == 404
 
-    url = reverse("api:builder:domains:ask_exists") + "?domain=nothing.com"
-    response = api_client.get(url)
+    response = api_client.get(url, {"domain": "nothing.com"})
     assert response.status_code == 404
 
-    url = reverse("api:builder:domains:ask_exists") + "?domain=test2.getbaserow.io"
-    response = api_client.get(url)
+    response = api_client.get(url, {"domain": "test2.getbaserow.io"})
     assert response.status_code == 404
 
-    url = reverse("api:builder:domains:ask_exists") + "?domain=another-domain.com"
-    response = api_client.get(url)
+    response = api_client.get(url, {"domain": "another-domain.com"})
     assert response.status_code == 404
 
-    url = reverse("api:builder:domains:ask_exists") + "?domain=test.getbaserow.io"
-    response = api_client.get(url)
+    response = api_client.get(url, {"domain": "test.getbaserow.io"})
     assert response.status_code == 200
 
 
@@ -603,16 +588,15 @@ def test_ask_public_builder_domain_exists(api_client, data_fixture):
 def test_ask_public_builder_domain_exists_with_public_backend_and_web_frontend_domains(
     api_client, data_fixture
 ):
-    url = reverse("api:builder:domains:ask_exists") + "?domain=localhost"
-    response = api_client.get(url)
+    url = reverse("api:builder:domains:ask_exists")
+
+    response = api_client.get(url, {"domain": "localhost"})
     assert response.status_code == 404
 
-    url = reverse("api:builder:domains:ask_exists") + "?domain=backend.localhost"
-    response = api_client.get(url)
+    response = api_client.get(url, {"domain": "backend.localhost"})
     assert response.status_code == 200
 
-    url = reverse("api:builder:domains:ask_exists") + "?domain=web-frontend.localhost"
-    response = api_client.get(url)
+    response = api_client.get(url, {"domain": "web-frontend.localhost"})
     assert response.status_code == 200
 
 
@@ -795,7 +779,7 @@ def test_public_dispatch_data_sources_view_returns_error(
 def user_source_user_fixture(data_fixture):
     """A fixture to provide a user source user."""
 
-    user, token = data_fixture.create_user_and_token()
+    user = data_fixture.create_user()
     workspace = data_fixture.create_workspace(user=user)
     builder = data_fixture.create_builder_application(user=user, workspace=workspace)
     integration = data_fixture.create_local_baserow_integration(
@@ -875,7 +859,7 @@ def test_public_dispatch_data_source_view_returns_all_fields(
 
     builder = user_source_user_fixture["builder"]
     builder.workspace = None
-    builder.save()
+    builder.save(update_fields=["workspace"])
     data_fixture.create_builder_custom_domain(published_to=builder)
 
     url = reverse(
@@ -943,7 +927,7 @@ def test_public_dispatch_data_source_view_returns_some_fields(
 
     builder = user_source_user_fixture["builder"]
     builder.workspace = None
-    builder.save()
+    builder.save(update_fields=["workspace"])
     data_fixture.create_builder_custom_domain(published_to=builder)
 
     url = reverse(
@@ -972,7 +956,7 @@ def test_public_dispatch_data_source_view_returns_some_fields(
 
 @pytest.mark.django_db
 def test_public_dispatch_data_sources_get_row_no_elements(
-    api_client, data_fixture, user_source_user_fixture
+    api_client, data_fixture, user_source_user_fixture, django_assert_max_num_queries
 ):
     """
     Test the DispatchDataSourcesView endpoint when using a Data Source type
@@ -1007,7 +991,7 @@ def test_public_dispatch_data_sources_get_row_no_elements(
 
     builder = page.builder
     builder.workspace = None
-    builder.save()
+    builder.save(update_fields=["workspace"])
     data_fixture.create_builder_custom_domain(published_to=builder)
 
     url = reverse(
@@ -1016,12 +1000,13 @@ def test_public_dispatch_data_sources_get_row_no_elements(
     )
     user_token = user_source_user_fixture["user_source_user_token"]
 
-    response = api_client.post(
-        url,
-        {},
-        format="json",
-        HTTP_AUTHORIZATION=f"JWT {user_token}",
-    )
+    with django_assert_max_num_queries(38):
+        response = api_client.post(
+            url,
+            {},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {user_token}",
+        )
 
     assert response.status_code == HTTP_200_OK
     assert response.json() == {str(data_source.id): {}}
@@ -1029,7 +1014,7 @@ def test_public_dispatch_data_sources_get_row_no_elements(
 
 @pytest.mark.django_db
 def test_public_dispatch_data_sources_list_rows_no_elements(
-    api_client, data_fixture, user_source_user_fixture
+    api_client, data_fixture, user_source_user_fixture, django_assert_max_num_queries
 ):
     """
     Test the DispatchDataSourcesView endpoint when using a Data Source type
@@ -1063,7 +1048,7 @@ def test_public_dispatch_data_sources_list_rows_no_elements(
 
     builder = user_source_user_fixture["builder"]
     builder.workspace = None
-    builder.save()
+    builder.save(update_fields=["workspace"])
     data_fixture.create_builder_custom_domain(published_to=builder)
 
     url = reverse(
@@ -1072,12 +1057,13 @@ def test_public_dispatch_data_sources_list_rows_no_elements(
     )
     user_token = user_source_user_fixture["user_source_user_token"]
 
-    response = api_client.post(
-        url,
-        {},
-        format="json",
-        HTTP_AUTHORIZATION=f"JWT {user_token}",
-    )
+    with django_assert_max_num_queries(38):
+        response = api_client.post(
+            url,
+            {},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {user_token}",
+        )
 
     assert response.status_code == HTTP_200_OK
     assert response.json() == {
@@ -1104,6 +1090,7 @@ def test_public_dispatch_data_sources_list_rows_with_elements_and_role(
     user_role,
     element_role,
     expect_fields,
+    django_assert_max_num_queries,
 ):
     """
     Test the DispatchDataSourcesView endpoint when using a Data Source type
@@ -1160,30 +1147,27 @@ def test_public_dispatch_data_sources_list_rows_with_elements_and_role(
         kwargs={"page_id": page.id},
     )
 
-    response = api_client.post(
-        url,
-        {},
-        format="json",
-        HTTP_AUTHORIZATION=f"JWT {token}",
-    )
-
-    expected_results = []
-    for row in data_source_element_roles_fixture["rows"]:
-        result = {"id": row.id}
-        if expect_fields:
-            # Field should only be visible if the user's role allows them
-            # to see the data source fields.
-            result[f"field_{field_id}"] = getattr(row, f"field_{field_id}")
-
-        expected_results.append(result)
+    with django_assert_max_num_queries(41):
+        response = api_client.post(
+            url,
+            {},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
 
     assert response.status_code == HTTP_200_OK
 
     if expect_fields:
+        # Field should only be visible if the user's role allows them
+        # to see the data source fields.
+        field_name = f"field_{field_id}"
         assert response.json() == {
             str(data_source.id): {
                 "has_next_page": False,
-                "results": expected_results,
+                "results": [
+                    {"id": row.id, field_name: getattr(row, field_name)}
+                    for row in data_source_element_roles_fixture["rows"]
+                ],
             },
         }
     else:
@@ -1195,84 +1179,159 @@ def test_public_dispatch_data_sources_list_rows_with_elements_and_role(
         }
 
 
+@pytest.mark.django_db
+def test_public_dispatch_data_sources_num_queries_does_not_grow_with_elements(
+    data_fixture,
+    api_client,
+    data_source_element_roles_fixture,
+    django_assert_num_queries,
+):
+    page = data_source_element_roles_fixture["page"]
+
+    user_source, integration = data_fixture.create_user_table_and_role(
+        data_source_element_roles_fixture["user"],
+        data_source_element_roles_fixture["builder_to"],
+        "foo_role",
+    )
+    user_source_user = UserSourceUser(
+        user_source, None, 1, "foo_username", "foo@bar.com"
+    )
+    token = user_source_user.get_refresh_token().access_token
+
+    data_source = data_fixture.create_builder_local_baserow_list_rows_data_source(
+        user=data_source_element_roles_fixture["user"],
+        page=page,
+        integration=integration,
+        table=data_source_element_roles_fixture["table"],
+    )
+    field_id = data_source_element_roles_fixture["fields"][0].id
+
+    def create_table_element():
+        data_fixture.create_builder_table_element(
+            page=page,
+            data_source=data_source,
+            visibility=Element.VISIBILITY_TYPES.LOGGED_IN,
+            fields=[
+                {
+                    "name": "FieldA",
+                    "type": "text",
+                    "config": {"value": f"get('current_record.field_{field_id}')"},
+                },
+            ],
+        )
+
+    create_table_element()
+
+    url = reverse(
+        "api:builder:domains:public_dispatch_all",
+        kwargs={"page_id": page.id},
+    )
+
+    def dispatch():
+        response = api_client.post(
+            url, {}, format="json", HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        assert response.status_code == HTTP_200_OK
+
+    # The first dispatch fills the caches, so it's only used to warm them up.
+    dispatch()
+
+    with CaptureQueriesContext(connection) as captured:
+        dispatch()
+    # The next requests reset the queries of the connection.
+    num_queries = len(captured.captured_queries)
+
+    # Adding elements changes the page content, so the caches are warmed up again
+    # before comparing the two warm dispatches.
+    for _ in range(3):
+        create_table_element()
+    dispatch()
+
+    with django_assert_num_queries(num_queries):
+        dispatch()
+
+
+PAGE_VISIBILITY_ALL_CASES = [
+    (
+        "foo_role",
+        Page.ROLE_TYPES.ALLOW_ALL,
+        [],
+        "",
+        True,
+    ),
+    (
+        "foo_role",
+        Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
+        [],
+        "",
+        True,
+    ),
+    (
+        "foo_role",
+        Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
+        ["foo_role"],
+        "",
+        False,
+    ),
+    (
+        "foo_role",
+        Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
+        [],
+        "",
+        False,
+    ),
+    (
+        "foo_role",
+        Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
+        ["foo_role"],
+        "",
+        True,
+    ),
+    # The following should all fail (no field info returned) because
+    # although the Page visiblity allows access, the Element visibility
+    # does not.
+    (
+        "foo_role",
+        Page.ROLE_TYPES.ALLOW_ALL,
+        [],
+        "foo_role",
+        False,
+    ),
+    (
+        "foo_role",
+        Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
+        [],
+        "foo_role",
+        False,
+    ),
+    (
+        "foo_role",
+        Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
+        ["foo_role"],
+        "foo_role",
+        False,
+    ),
+    (
+        "foo_role",
+        Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
+        [],
+        "foo_role",
+        False,
+    ),
+    (
+        "foo_role",
+        Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
+        ["foo_role"],
+        "foo_role",
+        False,
+    ),
+]
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "user_role,page_role_type,page_roles,element_role,expect_fields",
-    [
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL,
-            [],
-            "",
-            True,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
-            [],
-            "",
-            True,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
-            ["foo_role"],
-            "",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
-            [],
-            "",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
-            ["foo_role"],
-            "",
-            True,
-        ),
-        # The following should all fail (no field info returned) because
-        # although the Page visiblity allows access, the Element visibility
-        # does not.
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL,
-            [],
-            "foo_role",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
-            [],
-            "foo_role",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
-            ["foo_role"],
-            "foo_role",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
-            [],
-            "foo_role",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
-            ["foo_role"],
-            "foo_role",
-            False,
-        ),
-    ],
+    PAGE_VISIBILITY_ALL_CASES,
 )
 def test_public_dispatch_data_sources_list_rows_with_page_visibility_all(
     api_client,
@@ -1283,6 +1342,7 @@ def test_public_dispatch_data_sources_list_rows_with_page_visibility_all(
     page_roles,
     element_role,
     expect_fields,
+    django_assert_max_num_queries,
 ):
     """
     Test the DispatchDataSourcesView endpoint when using a Data Source type
@@ -1301,7 +1361,7 @@ def test_public_dispatch_data_sources_list_rows_with_page_visibility_all(
     page.visibility = Page.VISIBILITY_TYPES.ALL
     page.role_type = page_role_type
     page.roles = page_roles
-    page.save()
+    page.save(update_fields=["visibility", "role_type", "roles"])
 
     user_source, integration = data_fixture.create_user_table_and_role(
         data_source_element_roles_fixture["user"],
@@ -1343,12 +1403,13 @@ def test_public_dispatch_data_sources_list_rows_with_page_visibility_all(
         kwargs={"page_id": page.id},
     )
 
-    response = api_client.post(
-        url,
-        {},
-        format="json",
-        HTTP_AUTHORIZATION=f"JWT {token}",
-    )
+    with django_assert_max_num_queries(41):
+        response = api_client.post(
+            url,
+            {},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
 
     assert response.status_code == HTTP_200_OK
 
@@ -1378,81 +1439,7 @@ def test_public_dispatch_data_sources_list_rows_with_page_visibility_all(
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "user_role,page_role_type,page_roles,element_role,expect_fields",
-    [
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL,
-            [],
-            "",
-            True,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
-            [],
-            "",
-            True,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
-            ["foo_role"],
-            "",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
-            [],
-            "",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
-            ["foo_role"],
-            "",
-            True,
-        ),
-        # The following should all fail (no field info returned) because
-        # although the Page visiblity allows access, the Element visibility
-        # does not.
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL,
-            [],
-            "foo_role",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
-            [],
-            "foo_role",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
-            ["foo_role"],
-            "foo_role",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
-            [],
-            "foo_role",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
-            ["foo_role"],
-            "foo_role",
-            False,
-        ),
-    ],
+    PAGE_VISIBILITY_ALL_CASES,
 )
 def test_public_dispatch_data_sources_get_row_with_page_visibility_all(
     api_client,
@@ -1463,6 +1450,7 @@ def test_public_dispatch_data_sources_get_row_with_page_visibility_all(
     page_roles,
     element_role,
     expect_fields,
+    django_assert_max_num_queries,
 ):
     """
     Test the DispatchDataSourcesView endpoint when using a Data Source type
@@ -1481,7 +1469,7 @@ def test_public_dispatch_data_sources_get_row_with_page_visibility_all(
     page.visibility = Page.VISIBILITY_TYPES.ALL
     page.role_type = page_role_type
     page.roles = page_roles
-    page.save()
+    page.save(update_fields=["visibility", "role_type", "roles"])
 
     user_source, integration = data_fixture.create_user_table_and_role(
         data_source_element_roles_fixture["user"],
@@ -1516,12 +1504,13 @@ def test_public_dispatch_data_sources_get_row_with_page_visibility_all(
         kwargs={"page_id": page.id},
     )
 
-    response = api_client.post(
-        url,
-        {},
-        format="json",
-        HTTP_AUTHORIZATION=f"JWT {token}",
-    )
+    with django_assert_max_num_queries(39):
+        response = api_client.post(
+            url,
+            {},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
 
     assert response.status_code == HTTP_200_OK
 
@@ -1533,60 +1522,63 @@ def test_public_dispatch_data_sources_get_row_with_page_visibility_all(
         assert response.json() == {str(data_source.id): {}}
 
 
+PAGE_VISIBILITY_LOGGED_IN_CASES = [
+    (
+        "foo_role",
+        Page.ROLE_TYPES.ALLOW_ALL,
+        [],
+        "foo_role",
+        True,
+    ),
+    (
+        "foo_role",
+        Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
+        [],
+        "foo_role",
+        True,
+    ),
+    (
+        "foo_role",
+        Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
+        ["foo_role"],
+        "foo_role",
+        True,
+    ),
+    (
+        "foo_role",
+        Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
+        [],
+        "bar_role",
+        False,
+    ),
+    (
+        "foo_role",
+        Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
+        ["foo_role"],
+        "bar_role",
+        False,
+    ),
+    (
+        "foo_role",
+        Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
+        ["foo_role"],
+        "foo_role",
+        False,
+    ),
+    (
+        "foo_role",
+        Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
+        [],
+        "foo_role",
+        False,
+    ),
+]
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "user_role,page_role_type,page_roles,element_role,expect_fields",
-    [
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL,
-            [],
-            "foo_role",
-            True,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
-            [],
-            "foo_role",
-            True,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
-            ["foo_role"],
-            "foo_role",
-            True,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
-            [],
-            "bar_role",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
-            ["foo_role"],
-            "bar_role",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
-            ["foo_role"],
-            "foo_role",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
-            [],
-            "foo_role",
-            False,
-        ),
-    ],
+    PAGE_VISIBILITY_LOGGED_IN_CASES,
 )
 def test_public_dispatch_data_sources_list_rows_with_page_visibility_logged_in(
     api_client,
@@ -1597,6 +1589,7 @@ def test_public_dispatch_data_sources_list_rows_with_page_visibility_logged_in(
     page_roles,
     element_role,
     expect_fields,
+    django_assert_max_num_queries,
 ):
     """
     Test the DispatchDataSourcesView endpoint when using a Data Source type
@@ -1615,7 +1608,7 @@ def test_public_dispatch_data_sources_list_rows_with_page_visibility_logged_in(
     page.visibility = Page.VISIBILITY_TYPES.LOGGED_IN
     page.role_type = page_role_type
     page.roles = page_roles
-    page.save()
+    page.save(update_fields=["visibility", "role_type", "roles"])
 
     user_source, integration = data_fixture.create_user_table_and_role(
         data_source_element_roles_fixture["user"],
@@ -1657,12 +1650,13 @@ def test_public_dispatch_data_sources_list_rows_with_page_visibility_logged_in(
         kwargs={"page_id": page.id},
     )
 
-    response = api_client.post(
-        url,
-        {},
-        format="json",
-        HTTP_AUTHORIZATION=f"JWT {token}",
-    )
+    with django_assert_max_num_queries(41):
+        response = api_client.post(
+            url,
+            {},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
 
     assert response.status_code == HTTP_200_OK
 
@@ -1692,57 +1686,7 @@ def test_public_dispatch_data_sources_list_rows_with_page_visibility_logged_in(
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "user_role,page_role_type,page_roles,element_role,expect_fields",
-    [
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL,
-            [],
-            "foo_role",
-            True,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
-            [],
-            "foo_role",
-            True,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
-            ["foo_role"],
-            "foo_role",
-            True,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
-            [],
-            "bar_role",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
-            ["foo_role"],
-            "bar_role",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.ALLOW_ALL_EXCEPT,
-            ["foo_role"],
-            "foo_role",
-            False,
-        ),
-        (
-            "foo_role",
-            Page.ROLE_TYPES.DISALLOW_ALL_EXCEPT,
-            [],
-            "foo_role",
-            False,
-        ),
-    ],
+    PAGE_VISIBILITY_LOGGED_IN_CASES,
 )
 def test_public_dispatch_data_sources_get_row_with_page_visibility_logged_in(
     api_client,
@@ -1753,6 +1697,7 @@ def test_public_dispatch_data_sources_get_row_with_page_visibility_logged_in(
     page_roles,
     element_role,
     expect_fields,
+    django_assert_max_num_queries,
 ):
     """
     Test the DispatchDataSourcesView endpoint when using a Data Source type
@@ -1771,7 +1716,7 @@ def test_public_dispatch_data_sources_get_row_with_page_visibility_logged_in(
     page.visibility = Page.VISIBILITY_TYPES.LOGGED_IN
     page.role_type = page_role_type
     page.roles = page_roles
-    page.save()
+    page.save(update_fields=["visibility", "role_type", "roles"])
 
     user_source, integration = data_fixture.create_user_table_and_role(
         data_source_element_roles_fixture["user"],
@@ -1806,12 +1751,13 @@ def test_public_dispatch_data_sources_get_row_with_page_visibility_logged_in(
         kwargs={"page_id": page.id},
     )
 
-    response = api_client.post(
-        url,
-        {},
-        format="json",
-        HTTP_AUTHORIZATION=f"JWT {token}",
-    )
+    with django_assert_max_num_queries(39):
+        response = api_client.post(
+            url,
+            {},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
 
     assert response.status_code == HTTP_200_OK
 
@@ -1866,7 +1812,7 @@ def test_list_elements_with_page_visibility_all(
     page.visibility = Page.VISIBILITY_TYPES.ALL
     page.role_type = page_role_type
     page.roles = page_roles
-    page.save()
+    page.save(update_fields=["visibility", "role_type", "roles"])
 
     user_source, integration = data_fixture.create_user_table_and_role(
         data_source_element_roles_fixture["user"],
@@ -1913,42 +1859,13 @@ def test_list_elements_with_page_visibility_all(
     if expect_fields:
         assert response.json() == [
             {
+                **PUBLIC_HEADING_ELEMENT,
                 "id": element.id,
-                "level": 1,
-                "order": "1.00000000000000000000",
                 "page_id": page.id,
-                "parent_element_id": None,
-                "place_in_container": None,
+                "visibility": "logged-in",
                 "role_type": "disallow_all_except",
                 "roles": [element_role],
-                "style_background": "none",
-                "style_background_color": "#ffffffff",
-                "style_background_file": None,
-                "style_background_mode": "fill",
-                "style_border_bottom_color": "border",
-                "style_border_bottom_size": 0,
-                "style_border_left_color": "border",
-                "style_border_left_size": 0,
-                "style_border_right_color": "border",
-                "style_border_right_size": 0,
-                "style_border_top_color": "border",
-                "style_border_top_size": 0,
-                "style_margin_bottom": 0,
-                "style_margin_left": 0,
-                "style_margin_right": 0,
-                "style_margin_top": 0,
-                "style_padding_bottom": 10,
-                "style_padding_left": 20,
-                "style_padding_right": 20,
-                "style_padding_top": 10,
-                "style_background_radius": 0,
-                "style_border_radius": 0,
-                "style_width": "normal",
-                "style_width_child": "normal",
-                "styles": {},
-                "type": "heading",
                 "value": f"get('data_source.{data_source.id}.field_{field_id}')",
-                "visibility": "logged-in",
             },
         ]
     else:
@@ -2039,7 +1956,7 @@ def test_list_elements_with_page_visibility_logged_in(
     page.visibility = Page.VISIBILITY_TYPES.LOGGED_IN
     page.role_type = page_role_type
     page.roles = page_roles
-    page.save()
+    page.save(update_fields=["visibility", "role_type", "roles"])
 
     user_source, integration = data_fixture.create_user_table_and_role(
         data_source_element_roles_fixture["user"],
@@ -2086,120 +2003,47 @@ def test_list_elements_with_page_visibility_logged_in(
     if expect_fields:
         assert response.json() == [
             {
+                **PUBLIC_HEADING_ELEMENT,
                 "id": element.id,
-                "level": 1,
-                "order": "1.00000000000000000000",
                 "page_id": page.id,
-                "parent_element_id": None,
-                "place_in_container": None,
+                "visibility": "logged-in",
                 "role_type": "disallow_all_except",
                 "roles": [element_role],
-                "style_background": "none",
-                "style_background_color": "#ffffffff",
-                "style_background_file": None,
-                "style_background_mode": "fill",
-                "style_border_bottom_color": "border",
-                "style_border_bottom_size": 0,
-                "style_border_left_color": "border",
-                "style_border_left_size": 0,
-                "style_border_right_color": "border",
-                "style_border_right_size": 0,
-                "style_border_top_color": "border",
-                "style_border_top_size": 0,
-                "style_margin_bottom": 0,
-                "style_margin_left": 0,
-                "style_margin_right": 0,
-                "style_margin_top": 0,
-                "style_padding_bottom": 10,
-                "style_padding_left": 20,
-                "style_padding_right": 20,
-                "style_padding_top": 10,
-                "style_background_radius": 0,
-                "style_border_radius": 0,
-                "style_width": "normal",
-                "style_width_child": "normal",
-                "styles": {},
-                "type": "heading",
                 "value": f"get('data_source.{data_source.id}.field_{field_id}')",
-                "visibility": "logged-in",
             },
         ]
     else:
         assert response.json() == []
 
 
-@pytest.mark.django_db
-def test_get_data_source_context_fields_are_excluded(api_client, data_fixture):
-    """
-    Test the PublicDataSourcesView. Ensure that data source context fields are
-    filtered out from the response.
-    """
-
-    user = data_fixture.create_user()
-    builder_from = data_fixture.create_builder_application(user=user)
-    builder_to = data_fixture.create_builder_application(user=user, workspace=None)
-    page = data_fixture.create_builder_page(builder=builder_to, user=user)
-    integration = data_fixture.create_local_baserow_integration(
-        application=builder_to, authorized_user=user, name="test"
-    )
-    database = data_fixture.create_database_application(workspace=builder_to.workspace)
-    table = data_fixture.create_database_table(database=database)
-    multiple_select_field = data_fixture.create_multiple_select_field(
-        table=table, name="option_field", order=1, primary=True
-    )
-    option_1 = data_fixture.create_select_option(
-        field=multiple_select_field, value="doom-red", color="red", order=0
-    )
-    option_2 = data_fixture.create_select_option(
-        field=multiple_select_field, value="quake-green", color="green", order=1
-    )
-    option_3 = data_fixture.create_select_option(
-        field=multiple_select_field, value="warcraft-blue", color="blue", order=1
-    )
-    options = [option_1, option_2, option_3]
-
-    data_fixture.create_builder_local_baserow_get_row_data_source(
-        page=page, user=user, integration=integration, table=table, row_id="1"
-    )
-    data_fixture.create_builder_local_baserow_list_rows_data_source(
-        page=page, user=user, integration=integration, table=table
-    )
-
-    data_fixture.create_builder_custom_domain(
-        domain_name="test.getbaserow.io",
-        published_to=page.builder,
-        builder=builder_from,
-    )
-
-    url = reverse(
-        "api:builder:domains:list_data_sources",
-        kwargs={"page_id": page.id},
-    )
-    response = api_client.get(
-        url,
-        format="json",
-    )
-
-    response_json = response.json()
-
-    assert response.status_code == HTTP_200_OK
-
-    # Test the Get Row data source
-    field_name = f"field_{multiple_select_field.id}"
-    assert response_json[0]["context_data"] == {}
-    assert field_name not in response_json[0]["schema"]["properties"]
-    assert field_name not in response_json[0]["schema"]["properties"]
-
-    # Test the List Rows data source
-    assert response_json[1]["context_data"] == {}
-    assert field_name not in response_json[1]["schema"]["items"]["properties"]
+SELECT_OPTION_SCHEMA_PROPERTIES = {
+    "color": {
+        "title": "color",
+        "type": "string",
+    },
+    "id": {
+        "title": "id",
+        "type": "number",
+    },
+    "value": {
+        "title": "value",
+        "type": "string",
+    },
+}
 
 
 @pytest.mark.django_db
-def test_get_data_source_context_fields_are_included(api_client, data_fixture):
+@pytest.mark.parametrize(
+    "element_uses_field",
+    [
+        pytest.param(False, id="excluded"),
+        pytest.param(True, id="included"),
+    ],
+)
+def test_get_data_source_context_fields(api_client, data_fixture, element_uses_field):
     """
     Test the PublicDataSourcesView. Ensure that data source context fields are
-    included if they are used by an element.
+    filtered out from the response, unless they are used by an element.
     """
 
     user = data_fixture.create_user()
@@ -2214,16 +2058,14 @@ def test_get_data_source_context_fields_are_included(api_client, data_fixture):
     multiple_select_field = data_fixture.create_multiple_select_field(
         table=table, name="option_field", order=1, primary=True
     )
-    option_1 = data_fixture.create_select_option(
-        field=multiple_select_field, value="doom-red", color="red", order=0
-    )
-    option_2 = data_fixture.create_select_option(
-        field=multiple_select_field, value="quake-green", color="green", order=1
-    )
-    option_3 = data_fixture.create_select_option(
-        field=multiple_select_field, value="warcraft-blue", color="blue", order=1
+    options = data_fixture.create_select_options(
+        multiple_select_field,
+        [
+            {"value": "doom-red", "color": "red", "order": 0},
+            {"value": "quake-green", "color": "green", "order": 1},
+            {"value": "warcraft-blue", "color": "blue", "order": 1},
+        ],
     )
-    options = [option_1, option_2, option_3]
 
     data_source_1 = data_fixture.create_builder_local_baserow_get_row_data_source(
         page=page, user=user, integration=integration, table=table, row_id="1"
@@ -2232,11 +2074,12 @@ def test_get_data_source_context_fields_are_included(api_client, data_fixture):
         page=page, user=user, integration=integration, table=table
     )
 
-    # Create an element that uses the field
-    data_fixture.create_builder_heading_element(
-        page=page,
-        value=f"get('data_source.{data_source_1.id}.field_{multiple_select_field.id}')",
-    )
+    if element_uses_field:
+        # Create an element that uses the field
+        data_fixture.create_builder_heading_element(
+            page=page,
+            value=f"get('data_source.{data_source_1.id}.field_{multiple_select_field.id}')",
+        )
 
     data_fixture.create_builder_custom_domain(
         domain_name="test.getbaserow.io",
@@ -2257,57 +2100,52 @@ def test_get_data_source_context_fields_are_included(api_client, data_fixture):
 
     assert response.status_code == HTTP_200_OK
 
-    expected_context_data = [
-        {
-            "color": option.color,
-            "id": option.id,
-            "value": option.value,
-        }
-        for option in options
-    ]
-    expected_properties = {
-        "color": {
-            "title": "color",
-            "type": "string",
-        },
-        "id": {
-            "title": "id",
-            "type": "number",
-        },
-        "value": {
-            "title": "value",
-            "type": "string",
-        },
-    }
-
-    # Test the Get Row data source
     field_name = f"field_{multiple_select_field.id}"
-    assert response_json[0]["context_data"] == {field_name: expected_context_data}
-    assert (
-        response_json[0]["schema"]["properties"][field_name]["items"]["properties"]
-        == expected_properties
-    )
-    assert (
-        response_json[0]["schema"]["properties"][field_name]["metadata"][
-            "select_options"
-        ]
-        == expected_context_data
-    )
 
-    # Test the List Rows data source
-    assert response_json[1]["context_data"] == {field_name: expected_context_data}
-    assert (
-        response_json[1]["schema"]["items"]["properties"][field_name]["items"][
-            "properties"
-        ]
-        == expected_properties
-    )
-    assert (
-        response_json[1]["schema"]["items"]["properties"][field_name]["metadata"][
-            "select_options"
+    if element_uses_field:
+        expected_context_data = [
+            {
+                "color": option.color,
+                "id": option.id,
+                "value": option.value,
+            }
+            for option in options
         ]
-        == expected_context_data
-    )
+        # Test the Get Row data source
+        assert response_json[0]["context_data"] == {field_name: expected_context_data}
+        assert (
+            response_json[0]["schema"]["properties"][field_name]["items"]["properties"]
+            == SELECT_OPTION_SCHEMA_PROPERTIES
+        )
+        assert (
+            response_json[0]["schema"]["properties"][field_name]["metadata"][
+                "select_options"
+            ]
+            == expected_context_data
+        )
+
+        # Test the List Rows data source
+        assert response_json[1]["context_data"] == {field_name: expected_context_data}
+        assert (
+            response_json[1]["schema"]["items"]["properties"][field_name]["items"][
+                "properties"
+            ]
+            == SELECT_OPTION_SCHEMA_PROPERTIES
+        )
+        assert (
+            response_json[1]["schema"]["items"]["properties"][field_name]["metadata"][
+                "select_options"
+            ]
+            == expected_context_data
+        )
+    else:
+        # Test the Get Row data source
+        assert response_json[0]["context_data"] == {}
+        assert field_name not in response_json[0]["schema"]["properties"]
+
+        # Test the List Rows data source
+        assert response_json[1]["context_data"] == {}
+        assert field_name not in response_json[1]["schema"]["items"]["properties"]
 
 
 @pytest.mark.django_db
@@ -151,7 +151,7 @@ def test_create_element_bad_request(api_client, data_fixture):
 
 @pytest.mark.django_db
 def test_create_element_deactivated_type(
-    api_client, data_fixture, mutable_element_type_registry
+    api_client, data_fixture, mutable_element_type_registry, monkeypatch
 ):
     user, token = data_fixture.create_user_and_token()
     page = data_fixture.create_builder_page(user=user)
@@ -163,8 +163,7 @@ def test_create_element_deactivated_type(
         )
     )
 
-    prev_is_deactivated = regular_element_type.is_deactivated
-    regular_element_type.is_deactivated = lambda x: True
+    monkeypatch.setattr(regular_element_type, "is_deactivated", lambda x: True)
 
     url = reverse("api:builder:element:list", kwargs={"page_id": page.id})
     response = api_client.post(
@@ -174,8 +173,6 @@ def test_create_element_deactivated_type(
         HTTP_AUTHORIZATION=f"JWT {token}",
     )
 
-    regular_element_type.is_deactivated = prev_is_deactivated
-
     response_json = response.json()
     assert response.status_code == HTTP_400_BAD_REQUEST
     assert response_json["error"] == "ERROR_ELEMENT_TYPE_DEACTIVATED"
@@ -6,7 +6,7 @@ from baserow.contrib.builder.domains.exceptions import (
     DomainNotInBuilder,
 )
 from baserow.contrib.builder.domains.handler import DomainHandler
-from baserow.contrib.builder.domains.models import Domain
+from baserow.contrib.builder.domains.models import CustomDomain, Domain
 from baserow.contrib.builder.exceptions import BuilderDoesNotExist
 from baserow.contrib.builder.models import Builder
 from baserow.core.cache import global_cache
@@ -55,6 +55,20 @@ def test_get_domains(data_fixture):
     assert len(domains) == 2
 
 
+@pytest.mark.django_db
+def test_get_domains_num_queries(data_fixture, django_assert_num_queries):
+    builder = data_fixture.create_builder_application()
+    data_fixture.create_builder_custom_domain(builder=builder)
+    data_fixture.create_builder_custom_domain(builder=builder)
+    data_fixture.create_builder_custom_domain(builder=builder)
+
+    # One query for the base domains and one for the custom domains.
+    with django_assert_num_queries(2):
+        domains = DomainHandler().get_domains(builder)
+
+    assert all(isinstance(domain, CustomDomain) for domain in domains)
+
+
 @pytest.mark.django_db
 def test_create_domain(data_fixture):
     builder = data_fixture.create_builder_application()
@@ -68,6 +82,19 @@ def test_create_domain(data_fixture):
     assert domain.domain_name == "test.com"
 
 
+@pytest.mark.django_db
+def test_create_domain_order(data_fixture):
+    builder = data_fixture.create_builder_application()
+    data_fixture.create_builder_custom_domain(builder=builder, order=5)
+
+    domain = DomainHandler().create_domain(
+        CustomDomainType(), builder, domain_name="test.com"
+    )
+
+    assert domain.order == 6
+    assert Domain.objects.get(id=domain.id).order == 6
+
+
 @pytest.mark.django_db
 def test_delete_domain(data_fixture):
     domain = data_fixture.create_builder_custom_domain()
@@ -88,6 +115,23 @@ def test_update_domain(data_fixture):
     assert domain.domain_name == "new.com"
 
 
+@pytest.mark.django_db
+def test_update_domain_only_writes_the_updated_fields(data_fixture):
+    domain = data_fixture.create_builder_custom_domain(domain_name="test.com")
+    last_published = domain.last_published
+
+    # Another process changes a column that isn't updated.
+    Domain.objects.filter(id=domain.id).update(order=42)
+
+    DomainHandler().update_domain(domain, domain_name="new.com")
+
+    domain.refresh_from_db()
+
+    assert domain.domain_name == "new.com"
+    assert domain.order == 42
+    assert domain.last_published == last_published
+
+
 @pytest.mark.django_db
 def test_order_domains(data_fixture):
     builder = data_fixture.create_builder_application()
@@ -106,6 +150,32 @@ def test_order_domains(data_fixture):
     assert domain_two.order == 1
 
 
+@pytest.mark.django_db
+def test_order_domains_partial_order(data_fixture, django_assert_num_queries):
+    builder = data_fixture.create_builder_application()
+    domain_one = data_fixture.create_builder_custom_domain(builder=builder, order=1)
+    domain_two = data_fixture.create_builder_custom_domain(builder=builder, order=2)
+    domain_three = data_fixture.create_builder_custom_domain(builder=builder, order=3)
+    domain_four = data_fixture.create_builder_custom_domain(builder=builder, order=4)
+
+    # One query to fetch the current order and one to update it.
+    with django_assert_num_queries(2):
+        full_order = DomainHandler().order_domains(
+            builder, [domain_four.id, domain_two.id]
+        )
+
+    assert full_order == [
+        domain_one.id,
+        domain_three.id,
+        domain_four.id,
+        domain_two.id,
+    ]
+    assert (
+        list(Domain.objects.filter(builder=builder).values_list("id", flat=True))
+        == full_order
+    )
+
+
 @pytest.mark.django_db
 def test_order_domains_domain_not_in_builder(data_fixture):
     builder = data_fixture.create_builder_application()
@@ -133,6 +203,22 @@ def test_get_public_builder_by_name(data_fixture):
     assert builder_to == result
 
 
+@pytest.mark.django_db
+def test_get_public_builder_by_name_num_queries(
+    data_fixture, django_assert_num_queries
+):
+    builder = data_fixture.create_builder_application()
+    builder_to = data_fixture.create_builder_application(workspace=None)
+    domain1 = data_fixture.create_builder_custom_domain(
+        builder=builder, published_to=builder_to
+    )
+
+    with django_assert_num_queries(1):
+        result = DomainHandler().get_public_builder_by_domain_name(domain1.domain_name)
+
+    assert builder_to == result
+
+
 @pytest.mark.django_db
 def test_get_published_builder_by_missing_domain_name(data_fixture):
     builder = data_fixture.create_builder_application()
@@ -208,6 +294,24 @@ def test_domain_publishing(data_fixture):
     assert Builder.objects.count() == 2
 
 
+@pytest.mark.django_db
+def test_domain_publishing_user_source_uids(data_fixture):
+    builder = data_fixture.create_builder_application()
+    user_source1 = data_fixture.create_user_source_with_first_type(application=builder)
+    user_source2 = data_fixture.create_user_source_with_first_type(application=builder)
+
+    domain1 = data_fixture.create_builder_custom_domain(builder=builder)
+
+    domain1 = DomainHandler().publish(domain1)
+
+    assert [
+        user_source.uid for user_source in domain1.published_to.user_sources.all()
+    ] == [
+        f"domain_{domain1.id}__{user_source1.uid}",
+        f"domain_{domain1.id}__{user_source2.uid}",
+    ]
+
+
 @pytest.mark.django_db
 def test_get_domain_for_builder(data_fixture):
     user = data_fixture.create_user()
@@ -278,3 +382,18 @@ def test_get_published_domain_applications(data_fixture):
     assert published_applications.count() == 2
     assert published_applications.contains(published_builder1)
     assert published_applications.contains(published_builder2)
+
+
+@pytest.mark.django_db
+def test_get_published_domain_applications_of_trashed_domain(data_fixture):
+    workspace = data_fixture.create_workspace()
+    builder = data_fixture.create_builder_application(workspace=workspace)
+    published_builder = data_fixture.create_builder_application(workspace=None)
+    data_fixture.create_builder_custom_domain(
+        builder=builder, published_to=published_builder, trashed=True
+    )
+
+    published_applications = DomainHandler().get_published_domain_applications(
+        workspace
+    )
+    assert list(published_applications) == [published_builder]
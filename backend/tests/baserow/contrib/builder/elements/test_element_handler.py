@@ -27,7 +27,7 @@ def pytest_generate_tests(metafunc):
 
 
 @pytest.mark.django_db
-def test_create_element(data_fixture, element_type):
+def test_create_element(data_fixture, element_type, monkeypatch):
     page = data_fixture.create_builder_page()
     shared_page = page.builder.shared_page
 
@@ -36,13 +36,10 @@ def test_create_element(data_fixture, element_type):
     if element_type.is_multi_page_element:
         page = shared_page
 
-    prev_is_deactivated = element_type.is_deactivated
-    element_type.is_deactivated = lambda x: False
+    monkeypatch.setattr(element_type, "is_deactivated", lambda x: False)
 
     element = ElementHandler().create_element(element_type, page=page, **pytest_params)
 
-    element_type.is_deactivated = prev_is_deactivated
-
     assert element.page.id == page.id
 
     for key, value in pytest_params.items():
@@ -81,7 +78,9 @@ def test_create_element_and_shared_page(data_fixture):
 
 
 @pytest.mark.django_db
-def test_create_element_deactivated_type(data_fixture, mutable_element_type_registry):
+def test_create_element_deactivated_type(
+    data_fixture, mutable_element_type_registry, monkeypatch
+):
     page = data_fixture.create_builder_page()
 
     regular_element_type = next(
@@ -91,8 +90,7 @@ def test_create_element_deactivated_type(data_fixture, mutable_element_type_regi
         )
     )
 
-    prev_is_deactivated = regular_element_type.is_deactivated
-    regular_element_type.is_deactivated = lambda x: True
+    monkeypatch.setattr(regular_element_type, "is_deactivated", lambda x: True)
 
     with pytest.raises(ElementTypeDeactivated):
         ElementHandler().create_element(
@@ -101,8 +99,6 @@ def test_create_element_deactivated_type(data_fixture, mutable_element_type_regi
             **regular_element_type.get_pytest_params(data_fixture),
         )
 
-    regular_element_type.is_deactivated = prev_is_deactivated
-
 
 @pytest.mark.django_db
 def test_get_element(data_fixture):
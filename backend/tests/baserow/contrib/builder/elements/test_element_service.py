@@ -23,7 +23,7 @@ def pytest_generate_tests(metafunc):
 
 @pytest.mark.django_db
 @patch("baserow.contrib.builder.elements.service.element_created")
-def test_create_element(element_created_mock, data_fixture, element_type):
+def test_create_element(element_created_mock, data_fixture, element_type, monkeypatch):
     user = data_fixture.create_user()
     page = data_fixture.create_builder_page(user=user)
     shared_page = page.builder.shared_page
@@ -31,8 +31,7 @@ def test_create_element(element_created_mock, data_fixture, element_type):
     if element_type.is_multi_page_element:
         page = shared_page
 
-    prev_is_deactivated = element_type.is_deactivated
-    element_type.is_deactivated = lambda x: False
+    monkeypatch.setattr(element_type, "is_deactivated", lambda x: False)
 
     element1 = data_fixture.create_builder_heading_element(page=page, order="1.0000")
     element3 = data_fixture.create_builder_heading_element(page=page, order="2.0000")
@@ -42,8 +41,6 @@ def test_create_element(element_created_mock, data_fixture, element_type):
     service = ElementService()
     element = service.create_element(user, element_type, page=page, **pytest_params)
 
-    element_type.is_deactivated = prev_is_deactivated
-
     last_element = Element.objects.last()
 
     # Check it's the last element
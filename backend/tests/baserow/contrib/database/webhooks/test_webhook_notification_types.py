@@ -2,9 +2,11 @@ from django.test import override_settings
 
 import pytest
 
+from baserow.contrib.database.webhooks.models import TableWebhook
 from baserow.contrib.database.webhooks.notification_types import (
     WebhookDeactivatedNotificationType,
     WebhookPayloadTooLargeNotificationType,
+    get_webhook_workspace,
 )
 
 
@@ -74,3 +76,71 @@ def test_webhook_payload_too_large_can_be_render_as_email(data_fixture):
         "was too large. The content has been split into multiple batches, but "
         "data above the batch limit of 1 was discarded."
     )
+
+
+@pytest.mark.django_db
+def test_webhook_deactivated_notification_only_notifies_active_admins(data_fixture):
+    admin = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin)
+    member = data_fixture.create_user()
+    data_fixture.create_user_workspace(
+        workspace=workspace, user=member, permissions="MEMBER"
+    )
+    inactive_admin = data_fixture.create_user(is_active=False)
+    data_fixture.create_user_workspace(workspace=workspace, user=inactive_admin)
+    other_workspace_admin = data_fixture.create_user()
+    data_fixture.create_workspace(user=other_workspace_admin)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    webhook = data_fixture.create_table_webhook(
+        table=table, active=True, failed_triggers=1, name="test"
+    )
+
+    notification_recipients = (
+        WebhookDeactivatedNotificationType.notify_admins_in_workspace(webhook)
+    )
+
+    assert [recipient.recipient_id for recipient in notification_recipients] == [
+        admin.id
+    ]
+
+
+@pytest.mark.django_db
+def test_get_webhook_workspace(data_fixture, django_assert_num_queries):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    webhook = data_fixture.create_table_webhook(table=table)
+    webhook = TableWebhook.objects.get(id=webhook.id)
+
+    with django_assert_num_queries(1):
+        assert get_webhook_workspace(webhook).id == workspace.id
+        assert webhook.table.database_id == database.id
+
+
+@pytest.mark.django_db
+def test_get_webhook_workspace_with_selected_table(
+    data_fixture, django_assert_num_queries
+):
+    workspace = data_fixture.create_workspace()
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    webhook = data_fixture.create_table_webhook(table=table)
+    webhook = TableWebhook.objects.select_related("table__database__workspace").get(
+        id=webhook.id
+    )
+
+    with django_assert_num_queries(0):
+        assert get_webhook_workspace(webhook).id == workspace.id
+
+
+@pytest.mark.django_db
+def test_get_webhook_workspace_of_trashed_table(data_fixture):
+    workspace = data_fixture.create_workspace()
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database, trashed=True)
+    webhook = data_fixture.create_table_webhook(table=table)
+    webhook = TableWebhook.objects.get(id=webhook.id)
+
+    assert get_webhook_workspace(webhook).id == workspace.id
@@ -1,6 +1,7 @@
 from unittest.mock import Mock
 
-from django.db import transaction
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 
 import pytest
 from rest_framework.exceptions import ValidationError as DRFValidationError
@@ -28,10 +29,10 @@ from baserow.test_utils.pytest_conftest import FakeDispatchContext
 
 @pytest.mark.django_db
 def test_local_baserow_table_service_before_dispatch_validation_error(
-    data_fixture,
+    data_fixture, monkeypatch
 ):
     cls = LocalBaserowTableServiceType
-    cls.model_class = Mock()
+    monkeypatch.setattr(cls, "model_class", Mock(), raising=False)
 
     user = data_fixture.create_user()
     workspace = data_fixture.create_workspace(user=user)
@@ -96,7 +97,7 @@ def test_local_baserow_table_service_generate_schema_with_interesting_test_table
         # Responsible for resetting a schema's `metadata`,
         # it's simply a nested serialized field. Clearing it makes
         # testing this much simpler.
-        for field_id, obj in schema[field_name].items():
+        for obj in schema[field_name].values():
             obj["metadata"] = {}
 
     user = data_fixture.create_user()
@@ -1070,20 +1071,20 @@ def test_local_baserow_table_service_generate_schema_with_interesting_test_table
     )
 
 
-def test_local_baserow_service_type_get_schema_for_return_type():
+def test_local_baserow_service_type_get_schema_for_return_type(monkeypatch):
     mock_service = Mock(id=123)
     cls = LocalBaserowServiceType
-    cls.model_class = Mock()
+    monkeypatch.setattr(cls, "model_class", Mock(), raising=False)
     properties = {"1": {"field": "value"}}
 
-    cls.returns_list = True
+    monkeypatch.setattr(cls, "returns_list", True)
     assert cls().get_schema_for_return_type(mock_service, properties) == {
         "type": "array",
         "items": {"properties": properties, "type": "object"},
         "title": "Service123Schema",
     }
 
-    cls.returns_list = False
+    monkeypatch.setattr(cls, "returns_list", False)
     assert cls().get_schema_for_return_type(mock_service, properties) == {
         "type": "object",
         "properties": properties,
@@ -1103,7 +1104,9 @@ def test_local_baserow_table_service_type_schema_name():
     )
 
 
-def test_local_baserow_table_service_type_after_update_table_change_deletes_filters_and_sorts():
+def test_local_baserow_table_service_type_after_update_table_change_deletes_filters_and_sorts(
+    monkeypatch,
+):
     mock_instance = Mock()
     mock_from_table = Mock()
     mock_to_table = Mock()
@@ -1112,7 +1115,7 @@ def test_local_baserow_table_service_type_after_update_table_change_deletes_filt
     change_table_from_Table_to_Table = {"table": (mock_from_table, mock_to_table)}
 
     service_type_cls = LocalBaserowListRowsUserServiceType
-    service_type_cls.model_class = Mock()
+    monkeypatch.setattr(service_type_cls, "model_class", Mock())
     service_type = service_type_cls()
 
     service_type.after_update(mock_instance, {}, change_table_from_Table_to_None)
@@ -1181,6 +1184,48 @@ def test_local_baserow_table_service_type_get_context_data(data_fixture):
     )
 
 
+@pytest.mark.django_db
+def test_local_baserow_table_service_type_get_context_data_num_queries(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    service_type = LocalBaserowGetRowUserServiceType()
+
+    def create_service_with_select_fields(count):
+        table = data_fixture.create_database_table(user=user)
+        for index in range(count):
+            field = data_fixture.create_single_select_field(
+                table=table, name=f"Category {index}"
+            )
+            data_fixture.create_select_options(
+                field,
+                [
+                    {"value": "Bakery", "color": "red", "order": 0},
+                    {"value": "Grocery", "color": "green", "order": 1},
+                ],
+            )
+        return data_fixture.create_local_baserow_get_row_service(table=table)
+
+    # The context data of a table is cached, so every compared call is the first one
+    # of a new table. A throwaway call first fills the caches that aren't specific to
+    # a table.
+    service_type.get_context_data(create_service_with_select_fields(1))
+
+    service = create_service_with_select_fields(1)
+    with CaptureQueriesContext(connection) as captured:
+        service_type.get_context_data(service)
+    num_queries = len(captured.captured_queries)
+
+    # The select options of all the fields are fetched at once, so more select
+    # fields must not result in more queries.
+    service = create_service_with_select_fields(3)
+    with django_assert_num_queries(num_queries):
+        context_data = service_type.get_context_data(service)
+
+    assert len(context_data) == 3
+    assert all(len(options) == 2 for options in context_data.values())
+
+
 @pytest.mark.django_db
 def test_local_baserow_table_service_type_get_context_data_schema(data_fixture):
     user = data_fixture.create_user()
@@ -1243,7 +1288,7 @@ def test_local_baserow_table_service_type_get_context_data_schema(data_fixture):
 
 
 @pytest.mark.django_db
-def test_local_baserow_view_service_type_prepare_values(data_fixture):
+def test_local_baserow_view_service_type_prepare_values(data_fixture, monkeypatch):
     user = data_fixture.create_user()
     database = data_fixture.create_database_application(user=user)
     table_a = data_fixture.create_database_table(database=database)
@@ -1254,7 +1299,7 @@ def test_local_baserow_view_service_type_prepare_values(data_fixture):
     # We're just testing the `ViewServiceType`'s `prepare_values`, we don't
     # want to test any additional requirements for list rows.
     service_type = LocalBaserowViewServiceType
-    service_type.model_class = Mock()
+    monkeypatch.setattr(service_type, "model_class", Mock(), raising=False)
     instance = data_fixture.create_local_baserow_list_rows_service(
         table=table_a, view=view_a
     )